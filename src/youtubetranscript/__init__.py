@@ -17,6 +17,7 @@ Quick start::
 Get your free API key at https://youtubetranscript.dev
 """
 
+from youtubetranscript._version import __version__  # noqa: F401
 from youtubetranscript.client import YouTubeTranscript
 from youtubetranscript.async_client import AsyncYouTubeTranscript
 from youtubetranscript.models import (
@@ -36,7 +37,6 @@ from youtubetranscript.exceptions import (
     ServerError,
 )
 
-__version__ = "0.1.1"
 __all__ = [
     "YouTubeTranscript",
     "AsyncYouTubeTranscript",
@@ -0,0 +1,228 @@
+"""Internal helpers shared by the sync and async clients."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+import httpx
+
+from youtubetranscript.exceptions import YouTubeTranscriptError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Decode JSON straight from response bytes; orjson is used when installed.
+loads = orjson.loads if orjson is not None else json.loads
+
+
+def decode_body(content: bytes) -> Any:
+    """Decode a successful response body; every call returns fresh objects."""
+    try:
+        return loads(content)
+    except ValueError:
+        raise YouTubeTranscriptError("Invalid JSON in response") from None
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Bare video ID, and an ID embedded in a watch/short/embed/youtu.be URL.
+_VIDEO_ID_RE = re.compile(r"[0-9A-Za-z_-]{11}")
+_VIDEO_URL_RE = re.compile(
+    r"(?:youtu\.be/|[?&]v=|/(?:shorts|embed|live|v)/)([0-9A-Za-z_-]{11})(?![0-9A-Za-z_-])"
+)
+
+# Methods that can be resent without risking duplicate work on the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Statuses sent before the request was processed, so any method may be retried.
+# A plain 500 may come after the server already started a job or spent credits.
+SAFE_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Timeouts raised before the request was sent.
+SAFE_RETRY_TIMEOUTS = (httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def retry_delay(
+    attempt: int,
+    max_backoff: float,
+    retry_after: Optional[float] = None,
+) -> Optional[float]:
+    """
+    Seconds to sleep before retry number ``attempt + 1``.
+
+    Uses capped exponential backoff with full jitter. A server-provided
+    ``retry_after`` wins when it is larger; if it exceeds ``max_backoff``
+    the caller should stop retrying, so ``None`` is returned.
+    """
+    if retry_after is not None and retry_after > max_backoff:
+        return None
+    delay = random.uniform(0, min(max_backoff, 2 ** attempt))
+    if retry_after is not None and retry_after > delay:
+        return retry_after
+    return delay
+
+
+def parse_video_id(video: str) -> str:
+    """Return the 11-character video ID from a YouTube URL or bare ID."""
+    video = video.strip()
+    if _VIDEO_ID_RE.fullmatch(video):
+        return video
+    match = _VIDEO_URL_RE.search(video)
+    if match is None:
+        raise ValueError(f"Not a YouTube video URL or ID: {video!r}")
+    return match.group(1)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a ``Retry-After`` value given as delta-seconds or an HTTP-date."""
+    if value is None or value == "":
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class TTLCache:
+    """Bounded, thread-safe cache where every entry expires on its own."""
+
+    __slots__ = ("_max_entries", "_data", "_lock")
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            if key in self._data:
+                del self._data[key]
+            elif len(self._data) >= self._max_entries:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class TokenBucket:
+    """
+    Client-side limiter allowing ``max_calls`` requests per ``period`` seconds.
+
+    ``reserve()`` takes a token up front and returns how long the caller
+    must wait before using it, so concurrent callers queue in arrival order
+    without holding a lock while they sleep.
+    """
+
+    __slots__ = ("_capacity", "_rate", "_tokens", "_updated", "_lock")
+
+    def __init__(self, max_calls: int, period: float):
+        if max_calls < 1 or period <= 0:
+            raise ValueError("rate_limit must be (max_calls >= 1, per_seconds > 0)")
+        self._capacity = float(max_calls)
+        self._rate = max_calls / period
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+
+class DiskCache:
+    """
+    Completed transcribe responses stored as JSON files under ``root``.
+
+    Files are written to a temporary name and renamed into place, so
+    concurrent writers never leave a partial file behind. The cache is
+    best-effort: unreadable entries count as misses and write errors are
+    ignored.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, root: Union[str, "os.PathLike[str]"]):
+        self._root = Path(root).expanduser()
+
+    @staticmethod
+    def key(body: Dict[str, Any]) -> str:
+        """Hash a transcribe body, so a URL and its bare video ID share one entry."""
+        video = body.get("video")
+        if isinstance(video, str):
+            try:
+                body = {**body, "video": parse_video_id(video)}
+            except ValueError:
+                pass
+        canonical = json.dumps(body, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return loads(self._path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, data: Dict[str, Any]) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(dumps(data))
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -3,11 +3,32 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import logging
+import os
+import sys
 import time
-from typing import Any, Dict, List, Optional, Union
+import warnings
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import httpx
 
+from youtubetranscript._utils import (
+    IDEMPOTENT_METHODS,
+    SAFE_RETRY_STATUSES,
+    SAFE_RETRY_TIMEOUTS,
+    DiskCache,
+    TokenBucket,
+    TTLCache,
+    decode_body,
+    dumps,
+    loads,
+    parse_retry_after,
+    parse_video_id,
+    retry_delay,
+)
+from youtubetranscript._version import __version__
 from youtubetranscript.exceptions import raise_for_status, YouTubeTranscriptError
 from youtubetranscript.models import (
     AccountStats,
@@ -16,8 +37,50 @@ from youtubetranscript.models import (
     TranscriptJob,
 )
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_BASE_URL = "https://youtubetranscript.dev/api"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+# Sent on every request. Content-Type is only added to requests with a JSON
+# body, and the API key is attached per request by _get/_post.
+_BASE_HEADERS = {"User-Agent": f"youtubetranscript-python/{__version__} (async)"}
+
+# Keeps close tasks for abandoned clients alive until they finish.
+_closing: Set[asyncio.Task] = set()
+
+
+def _close_abandoned(client: httpx.AsyncClient, owner: List[Any]) -> None:
+    """Schedule aclose() for a client that was garbage-collected unclosed."""
+    loop = owner[0]() if owner[0] is not None else None
+    if loop is None or loop.is_closed():
+        return  # the connections went away with the loop that owned them
+    # GC may run on another thread or inside another loop; only the owning
+    # loop can close the connections it created.
+    loop.call_soon_threadsafe(_schedule_close, client)
+
+
+def _schedule_close(client: httpx.AsyncClient) -> None:
+    task = asyncio.ensure_future(client.aclose())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+class _Shared:
+    """An in-flight request and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
 
 
 class AsyncYouTubeTranscript:
@@ -48,6 +111,13 @@ class AsyncYouTubeTranscript:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 2,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        pool_limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        rate_limit: Optional[Tuple[int, float]] = None,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        keep_raw: bool = False,
     ):
         if not api_key or len(api_key.strip()) < 8:
             raise ValueError(
@@ -55,15 +125,33 @@ class AsyncYouTubeTranscript:
             )
 
         self._api_key = api_key.strip()
+        self._auth_headers = {"Authorization": f"Bearer {self._api_key}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
         self._base_url = base_url.rstrip("/")
         self._max_retries = max_retries
+        self._max_backoff = max_backoff
+        self._cache_ttl = cache_ttl
+        self._cache = TTLCache()
+        self._rate_limiter = TokenBucket(*rate_limit) if rate_limit else None
+        self._disk_cache = DiskCache(cache_dir) if cache_dir is not None else None
+        self._keep_raw = keep_raw
+        self._inflight: Dict[tuple, _Shared] = {}
         self._client = httpx.AsyncClient(
+            base_url=self._base_url,
             timeout=timeout,
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "youtubetranscript-python/0.1.0 (async)",
-            },
+            limits=pool_limits or DEFAULT_POOL_LIMITS,
+            http2=http2,
+            headers=_BASE_HEADERS,
+        )
+        # Weak reference to the loop the connections belong to, recorded here
+        # or on the first request.
+        self._owner_loop: List[Any] = [None]
+        try:
+            self._owner_loop[0] = weakref.ref(asyncio.get_running_loop())
+        except RuntimeError:
+            pass
+        self._finalizer = weakref.finalize(
+            self, _close_abandoned, self._client, self._owner_loop
         )
 
     async def __aenter__(self):
@@ -73,8 +161,16 @@ class AsyncYouTubeTranscript:
         await self.close()
 
     async def close(self):
+        """Close the HTTP client. Safe to call more than once."""
+        if not self._finalizer.alive:
+            return
+        self._finalizer.detach()
         await self._client.aclose()
 
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        self._cache.clear()
+
     # ─── Core Methods ────────────────────────────────────────────────
 
     async def transcribe(
@@ -84,6 +180,7 @@ class AsyncYouTubeTranscript:
         language: Optional[str] = None,
         source: Optional[str] = None,
         format: Optional[Union[str, Dict[str, bool]]] = None,
+        no_cache: bool = False,
     ) -> Transcript:
         """Extract transcript from a YouTube video."""
         body: Dict[str, Any] = {"video": video}
@@ -94,8 +191,78 @@ class AsyncYouTubeTranscript:
         if format:
             body["format"] = format
 
+        disk_cache = self._disk_cache
+        cache_key = None
+        if disk_cache is not None:
+            cache_key = DiskCache.key(body)
+            if not no_cache:
+                cached = disk_cache.get(cache_key)
+                if cached is not None:
+                    return Transcript.from_response(cached, keep_raw=self._keep_raw)
+
         data = await self._post("/v2/transcribe", body)
-        return Transcript.from_response(data)
+        transcript = Transcript.from_response(data, keep_raw=self._keep_raw)
+        if (
+            disk_cache is not None
+            and cache_key is not None
+            and transcript.status == "completed"
+            and (transcript.segments or transcript.text)
+        ):
+            disk_cache.set(cache_key, data)
+        return transcript
+
+    async def transcribe_many(
+        self,
+        videos: List[str],
+        *,
+        concurrency: int = 10,
+        language: Optional[str] = None,
+        source: Optional[str] = None,
+        format: Optional[Union[str, Dict[str, bool]]] = None,
+        return_exceptions: bool = True,
+    ) -> List[Union[Transcript, BaseException]]:
+        """
+        Extract transcripts for many videos concurrently.
+
+        At most ``concurrency`` requests are in flight at once. Results are
+        returned in input order; a video that fails yields its exception
+        (e.g. ``NoCaptionsError``) in place of a Transcript instead of
+        cancelling the rest of the batch.
+
+        With ``return_exceptions=False`` the first failure is raised and all
+        outstanding requests are cancelled, freeing connections and credits
+        right away. On Python 3.11+ this uses ``asyncio.TaskGroup``.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(video: str) -> Transcript:
+            async with sem:
+                return await self.transcribe(
+                    video, language=language, source=source, format=format
+                )
+
+        if return_exceptions:
+            return await asyncio.gather(*(one(v) for v in videos), return_exceptions=True)
+
+        if sys.version_info >= (3, 11):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(one(v)) for v in videos]
+            except BaseExceptionGroup as eg:  # noqa: F821 - builtin on 3.11+
+                # Raise the failure itself so callers can catch e.g. NoCaptionsError.
+                raise eg.exceptions[0] from eg
+            return [t.result() for t in tasks]
+
+        futures = [asyncio.ensure_future(one(v)) for v in videos]
+        try:
+            return await asyncio.gather(*futures)
+        except BaseException:
+            for f in futures:
+                f.cancel()
+            raise
 
     async def transcribe_asr(
         self,
@@ -116,42 +283,63 @@ class AsyncYouTubeTranscript:
             body["webhook_url"] = webhook_url
 
         data = await self._post("/v2/transcribe", body)
-        return TranscriptJob.from_response(data)
+        return TranscriptJob.from_response(data, keep_raw=self._keep_raw)
 
-    async def get_job(self, job_id: str) -> TranscriptJob:
+    async def get_job(
+        self,
+        job_id: str,
+        *,
+        cache_ttl: Optional[float] = None,
+    ) -> TranscriptJob:
         """Check status of an ASR transcription job."""
         data = await self._get(f"/v2/jobs/{job_id}", params={
             "include_segments": "true",
             "include_paragraphs": "true",
             "include_words": "true",
-        })
-        return TranscriptJob.from_response(data)
+        }, cache_ttl=cache_ttl)
+        return TranscriptJob.from_response(data, keep_raw=self._keep_raw)
 
     async def wait_for_job(
         self,
         job_id: str,
         *,
-        poll_interval: float = 10.0,
         timeout: float = 1200.0,
+        initial_poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        poll_interval: Optional[float] = None,
     ) -> Transcript:
         """Poll an ASR job until completion."""
-        start = time.monotonic()
+        if poll_interval is not None:
+            warnings.warn(
+                "poll_interval is deprecated; use initial_poll_interval and "
+                "max_poll_interval instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            initial_poll_interval = max_poll_interval = poll_interval
+        if initial_poll_interval <= 0 or max_poll_interval <= 0:
+            raise ValueError("poll intervals must be greater than 0")
+
+        interval = min(initial_poll_interval, max_poll_interval)
+        deadline = time.monotonic() + timeout
         while True:
             job = await self.get_job(job_id)
             if job.is_complete and job.transcript:
                 return job.transcript
             if job.is_failed:
                 raise YouTubeTranscriptError(
-                    f"ASR job {job_id} failed: {job.raw.get('error', 'unknown')}",
+                    f"ASR job {job_id} failed: {job.error or 'unknown'}",
                     error_code="job_failed",
                 )
-            elapsed = time.monotonic() - start
-            if elapsed > timeout:
+            now = time.monotonic()
+            if now >= deadline:
                 raise YouTubeTranscriptError(
                     f"Timed out waiting for job {job_id} after {timeout}s",
                     error_code="timeout",
                 )
-            await asyncio.sleep(poll_interval)
+            # Never sleep past the deadline; the last poll happens right at it.
+            await asyncio.sleep(min(interval, deadline - now))
+            interval = min(max_poll_interval, interval * 2)
 
     async def batch(
         self,
@@ -163,96 +351,200 @@ class AsyncYouTubeTranscript:
         if len(video_ids) > 100:
             raise ValueError("Maximum 100 videos per batch request")
 
-        body: Dict[str, Any] = {"video_ids": video_ids}
+        # Reject malformed entries locally rather than failing the whole batch
+        # server-side; sending bare IDs also keeps the request body small.
+        body: Dict[str, Any] = {"video_ids": [parse_video_id(v) for v in video_ids]}
         if language:
             body["language"] = language
 
         data = await self._post("/v2/batch", body)
-        return BatchResult.from_response(data)
+        return BatchResult.from_response(data, keep_raw=self._keep_raw)
 
     async def get_batch(self, batch_id: str) -> BatchResult:
         """Check status of a batch request."""
         data = await self._get(f"/v2/batch/{batch_id}")
-        return BatchResult.from_response(data)
+        return BatchResult.from_response(data, keep_raw=self._keep_raw)
 
-    async def list_transcripts(self, **kwargs) -> Dict[str, Any]:
+    async def list_transcripts(
+        self,
+        *,
+        search: Optional[str] = None,
+        language: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 10,
+        page: int = 1,
+    ) -> Dict[str, Any]:
         """List your transcript history."""
-        params: Dict[str, Any] = {
-            "limit": kwargs.get("limit", 10),
-            "page": kwargs.get("page", 1),
-        }
-        for k in ("search", "language", "status"):
-            if kwargs.get(k):
-                params[k] = kwargs[k]
-        return await self._get("/v1/history", params=params)
+        params: Dict[str, Any] = {"limit": limit, "page": page}
+        if search:
+            params["search"] = search
+        if language:
+            params["language"] = language
+        if status:
+            params["status"] = status
+
+        return await self._get("/v1/history", params=params, cache_ttl=self._cache_ttl)
 
-    async def get_transcript(self, video_id: str, **kwargs) -> Transcript:
+    async def get_transcript(
+        self,
+        video_id: str,
+        *,
+        language: Optional[str] = None,
+        source: Optional[str] = None,
+        include_timestamps: bool = True,
+    ) -> Transcript:
         """Get a previously extracted transcript."""
-        params: Dict[str, Any] = {
-            "include_timestamps": str(kwargs.get("include_timestamps", True)).lower()
-        }
-        for k in ("language", "source"):
-            if kwargs.get(k):
-                params[k] = kwargs[k]
-        data = await self._get(f"/v1/transcripts/{video_id}", params=params)
-        return Transcript.from_response(data)
+        params: Dict[str, Any] = {"include_timestamps": str(include_timestamps).lower()}
+        if language:
+            params["language"] = language
+        if source:
+            params["source"] = source
+
+        data = await self._get(
+            f"/v1/transcripts/{video_id}", params=params, cache_ttl=self._cache_ttl
+        )
+        return Transcript.from_response(data, keep_raw=self._keep_raw)
 
     async def stats(self) -> AccountStats:
         """Get account stats."""
-        data = await self._get("/v1/stats")
-        return AccountStats.from_response(data)
+        data = await self._get("/v1/stats", cache_ttl=self._cache_ttl)
+        return AccountStats.from_response(data, keep_raw=self._keep_raw)
 
-    async def delete_transcript(self, **kwargs) -> Dict[str, Any]:
+    async def delete_transcript(
+        self,
+        *,
+        video_id: Optional[str] = None,
+        ids: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
         """Delete transcripts by video ID or record IDs."""
         body: Dict[str, Any] = {}
-        if kwargs.get("video_id"):
-            body["video_id"] = kwargs["video_id"]
-        if kwargs.get("ids"):
-            body["ids"] = kwargs["ids"]
+        if video_id:
+            body["video_id"] = video_id
+        if ids:
+            body["ids"] = ids
         return await self._post("/v1/transcripts/bulk-delete", body)
 
     # ─── HTTP Layer ──────────────────────────────────────────────────
 
     async def _post(self, path: str, body: dict) -> dict:
-        return await self._request("POST", path, json=body)
+        # Any write may change history, stats or stored transcripts.
+        self._cache.clear()
+        return await self._request("POST", path, content=dumps(body), headers=self._json_headers)
 
-    async def _get(self, path: str, params: Optional[dict] = None) -> dict:
-        return await self._request("GET", path, params=params)
+    async def _get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> dict:
+        if not cache_ttl:
+            return await self._request("GET", path, params=params, headers=self._auth_headers)
+
+        # Cache the body bytes so every hit decodes a fresh dict; results
+        # built from it (``raw``, segment ``words``) are never shared.
+        key = (path, tuple(sorted(params.items())) if params else ())
+        body = self._cache.get(key)
+        if body is None:
+            body = await self._request_body(
+                "GET", path, params=params, headers=self._auth_headers
+            )
+            self._cache.set(key, body, cache_ttl)
+        return decode_body(body)
 
     async def _request(self, method: str, path: str, **kwargs) -> dict:
-        url = f"{self._base_url}{path}"
+        return decode_body(await self._request_body(method, path, **kwargs))
+
+    async def _request_body(self, method: str, path: str, **kwargs) -> bytes:
+        # Identical concurrent requests share one round-trip (and one credit).
+        # The request runs as its own task so a caller being cancelled does
+        # not cancel it for everyone else waiting on the same result; once
+        # the last waiter is cancelled the request is cancelled too. Waiters
+        # share the body bytes and each decode their own copy.
+        if self._owner_loop[0] is None:
+            self._owner_loop[0] = weakref.ref(asyncio.get_running_loop())
+        key = (method, path, json.dumps(kwargs, sort_keys=True, default=str))
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = _Shared(asyncio.ensure_future(self._send(method, path, **kwargs)))
+            self._inflight[key] = shared
+
+            def done(t: asyncio.Future) -> None:
+                if self._inflight.get(key) is shared:
+                    del self._inflight[key]
+                if not t.cancelled():
+                    t.exception()  # retrieved even if every caller went away
+
+            shared.task.add_done_callback(done)
+
+        task = shared.task
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not task.done():
+                if self._inflight.get(key) is shared:
+                    del self._inflight[key]
+                task.cancel()
+
+    async def _send(self, method: str, path: str, **kwargs) -> bytes:
         last_exc = None
+        is_idempotent = method in IDEMPOTENT_METHODS
 
         for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
             try:
-                resp = await self._client.request(method, url, **kwargs)
+                async with self._client.stream(method, path, **kwargs) as resp:
+                    content = bytearray()
+                    async for chunk in resp.aiter_bytes():
+                        content += chunk
             except httpx.TimeoutException as e:
                 last_exc = YouTubeTranscriptError(f"Request timed out: {e}")
                 if attempt < self._max_retries:
-                    await asyncio.sleep(2 ** attempt)
-                    continue
+                    if is_idempotent or isinstance(e, SAFE_RETRY_TIMEOUTS):
+                        await asyncio.sleep(retry_delay(attempt, self._max_backoff) or 0)
+                        continue
+                    logger.debug(
+                        "Not retrying %s %s after %r: not idempotent", method, path, e
+                    )
                 raise last_exc from e
             except httpx.HTTPError as e:
                 raise YouTubeTranscriptError(f"HTTP error: {e}") from e
 
+            if resp.is_success:
+                return bytes(content)  # immutable, so waiters can share it
+
             try:
-                data = resp.json()
-            except Exception:
-                if not resp.is_success:
-                    raise YouTubeTranscriptError(
-                        f"Server returned {resp.status_code}: {resp.text[:200]}",
-                        status_code=resp.status_code,
+                data = loads(content)
+            except ValueError:
+                # Gateways answer 429/5xx with plain text or HTML; fall through
+                # so those are still retried and raised by status code.
+                data = {
+                    "message": f"Server returned {resp.status_code}: "
+                    f"{content[:200].decode('utf-8', 'replace')}"
+                }
+
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if resp.status_code == 429 and retry_after is None:
+                retry_after = parse_retry_after(data.get("retry_after"))
+            if (
+                resp.status_code == 429 or resp.status_code >= 500
+            ) and attempt < self._max_retries:
+                if is_idempotent or resp.status_code in SAFE_RETRY_STATUSES:
+                    delay = retry_delay(attempt, self._max_backoff, retry_after)
+                    if delay is not None:
+                        last_exc = None
+                        await asyncio.sleep(delay)
+                        continue
+                else:
+                    logger.debug(
+                        "Not retrying %s %s after %d: not idempotent",
+                        method, path, resp.status_code,
                     )
-                raise YouTubeTranscriptError("Invalid JSON in response")
-
-            if not resp.is_success and resp.status_code not in (202,):
-                if resp.status_code >= 500 and attempt < self._max_retries:
-                    last_exc = None
-                    await asyncio.sleep(2 ** attempt)
-                    continue
-                raise_for_status(resp.status_code, data)
-
-            return data
+            raise_for_status(resp.status_code, data, retry_after=retry_after)
 
         if last_exc:
             raise last_exc
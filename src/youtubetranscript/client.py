@@ -2,11 +2,32 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
+import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Union
+import warnings
+import weakref
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 
+from youtubetranscript._utils import (
+    IDEMPOTENT_METHODS,
+    SAFE_RETRY_STATUSES,
+    SAFE_RETRY_TIMEOUTS,
+    DiskCache,
+    TokenBucket,
+    TTLCache,
+    decode_body,
+    dumps,
+    loads,
+    parse_retry_after,
+    parse_video_id,
+    retry_delay,
+)
+from youtubetranscript._version import __version__
 from youtubetranscript.exceptions import raise_for_status, YouTubeTranscriptError
 from youtubetranscript.models import (
     AccountStats,
@@ -15,8 +36,33 @@ from youtubetranscript.models import (
     TranscriptJob,
 )
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_BASE_URL = "https://youtubetranscript.dev/api"
 DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_BACKOFF = 30.0
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=30.0,
+)
+
+# Sent on every request. Content-Type is only added to requests with a JSON
+# body, and the API key is attached per request by _get/_post.
+_BASE_HEADERS = {"User-Agent": f"youtubetranscript-python/{__version__}"}
+
+# httpx clients reused across instances created with shared_pool=True.
+_shared_pool: Dict[tuple, httpx.Client] = {}
+_shared_pool_lock = threading.Lock()
+
+
+@atexit.register
+def _close_shared_pool() -> None:
+    with _shared_pool_lock:
+        for client in _shared_pool.values():
+            client.close()
+        _shared_pool.clear()
 
 
 class YouTubeTranscript:
@@ -35,12 +81,16 @@ class YouTubeTranscript:
         result = yt.transcribe("dQw4w9WgXcQ", language="es")
 
         # Batch
-        results = yt.batch(["video1", "video2", "video3"])
+        results = yt.batch(["dQw4w9WgXcQ", "https://youtu.be/jNQXAC9IVRw"])
 
         # ASR (audio transcription)
         job = yt.transcribe_asr("dQw4w9WgXcQ")
         result = yt.wait_for_job(job.job_id)
 
+    Scripts that create many short-lived clients can pass
+    ``shared_pool=True`` to reuse one connection pool (and its TLS
+    sessions) across every instance with the same connection settings.
+
     Get your API key at https://youtubetranscript.dev
     """
 
@@ -51,6 +101,14 @@ class YouTubeTranscript:
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = 2,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        pool_limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        rate_limit: Optional[Tuple[int, float]] = None,
+        shared_pool: bool = False,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+        keep_raw: bool = False,
     ):
         if not api_key or len(api_key.strip()) < 8:
             raise ValueError(
@@ -58,15 +116,48 @@ class YouTubeTranscript:
             )
 
         self._api_key = api_key.strip()
+        self._auth_headers = {"Authorization": f"Bearer {self._api_key}"}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
         self._base_url = base_url.rstrip("/")
         self._max_retries = max_retries
-        self._client = httpx.Client(
-            timeout=timeout,
-            headers={
-                "Authorization": f"Bearer {self._api_key}",
-                "Content-Type": "application/json",
-                "User-Agent": "youtubetranscript-python/0.1.0",
-            },
+        self._max_backoff = max_backoff
+        self._cache_ttl = cache_ttl
+        self._cache = TTLCache()
+        self._rate_limiter = TokenBucket(*rate_limit) if rate_limit else None
+        self._disk_cache = DiskCache(cache_dir) if cache_dir is not None else None
+        self._keep_raw = keep_raw
+
+        limits = pool_limits or DEFAULT_POOL_LIMITS
+
+        def new_client() -> httpx.Client:
+            return httpx.Client(
+                base_url=self._base_url,
+                timeout=timeout,
+                limits=limits,
+                http2=http2,
+                headers=_BASE_HEADERS,
+            )
+
+        if shared_pool:
+            key = (
+                self._base_url,
+                timeout,
+                http2,
+                limits.max_connections,
+                limits.max_keepalive_connections,
+                limits.keepalive_expiry,
+            )
+            with _shared_pool_lock:
+                client = _shared_pool.get(key)
+                if client is None or client.is_closed:
+                    client = _shared_pool[key] = new_client()
+            self._client = client
+        else:
+            self._client = new_client()
+        # Closes the connection pool if the instance is dropped without close();
+        # pooled clients are left to the atexit hook.
+        self._finalizer = weakref.finalize(
+            self, (lambda: None) if shared_pool else self._client.close
         )
 
     def __enter__(self):
@@ -76,8 +167,18 @@ class YouTubeTranscript:
         self.close()
 
     def close(self):
-        """Close the HTTP client."""
-        self._client.close()
+        """
+        Close the HTTP client.
+
+        Safe to call more than once. A no-op with ``shared_pool=True``:
+        pooled connections stay open for other instances and are closed at
+        interpreter exit.
+        """
+        self._finalizer()
+
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        self._cache.clear()
 
     # ─── Core Methods ────────────────────────────────────────────────
 
@@ -88,6 +189,7 @@ class YouTubeTranscript:
         language: Optional[str] = None,
         source: Optional[str] = None,
         format: Optional[Union[str, Dict[str, bool]]] = None,
+        no_cache: bool = False,
     ) -> Transcript:
         """
         Extract transcript from a YouTube video.
@@ -98,6 +200,8 @@ class YouTubeTranscript:
             source: "auto" (default), "manual", or "asr".
             format: Format options — "timestamp", "paragraphs", "words",
                     or dict like {"timestamp": True, "paragraphs": True}.
+            no_cache: With ``cache_dir`` set, skip the cached copy and fetch
+                (and re-cache) a fresh transcript.
 
         Returns:
             Transcript object with segments, text, and export methods.
@@ -115,8 +219,25 @@ class YouTubeTranscript:
         if format:
             body["format"] = format
 
+        disk_cache = self._disk_cache
+        cache_key = None
+        if disk_cache is not None:
+            cache_key = DiskCache.key(body)
+            if not no_cache:
+                cached = disk_cache.get(cache_key)
+                if cached is not None:
+                    return Transcript.from_response(cached, keep_raw=self._keep_raw)
+
         data = self._post("/v2/transcribe", body)
-        return Transcript.from_response(data)
+        transcript = Transcript.from_response(data, keep_raw=self._keep_raw)
+        if (
+            disk_cache is not None
+            and cache_key is not None
+            and transcript.status == "completed"
+            and (transcript.segments or transcript.text)
+        ):
+            disk_cache.set(cache_key, data)
+        return transcript
 
     def transcribe_asr(
         self,
@@ -149,14 +270,21 @@ class YouTubeTranscript:
             body["webhook_url"] = webhook_url
 
         data = self._post("/v2/transcribe", body)
-        return TranscriptJob.from_response(data)
+        return TranscriptJob.from_response(data, keep_raw=self._keep_raw)
 
-    def get_job(self, job_id: str) -> TranscriptJob:
+    def get_job(
+        self,
+        job_id: str,
+        *,
+        cache_ttl: Optional[float] = None,
+    ) -> TranscriptJob:
         """
         Check status of an ASR transcription job.
 
         Args:
             job_id: Job ID returned from transcribe_asr().
+            cache_ttl: Reuse a response fetched within this many seconds.
+                Off by default since job status changes while polling.
 
         Returns:
             TranscriptJob with current status and transcript if complete.
@@ -165,47 +293,70 @@ class YouTubeTranscript:
             "include_segments": "true",
             "include_paragraphs": "true",
             "include_words": "true",
-        })
-        return TranscriptJob.from_response(data)
+        }, cache_ttl=cache_ttl)
+        return TranscriptJob.from_response(data, keep_raw=self._keep_raw)
 
     def wait_for_job(
         self,
         job_id: str,
         *,
-        poll_interval: float = 10.0,
         timeout: float = 1200.0,
+        initial_poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        poll_interval: Optional[float] = None,
     ) -> Transcript:
         """
         Poll an ASR job until completion.
 
+        The delay between polls starts at ``initial_poll_interval`` and
+        doubles after each poll up to ``max_poll_interval``, so short jobs
+        return quickly while long ones are not polled aggressively.
+
         Args:
             job_id: Job ID from transcribe_asr().
-            poll_interval: Seconds between polls (default 10).
             timeout: Max seconds to wait (default 1200 = 20 min).
+            initial_poll_interval: Seconds before the second poll (default 1).
+            max_poll_interval: Upper bound on seconds between polls (default 60).
+            poll_interval: Deprecated. Polls at this constant interval instead.
 
         Returns:
             Completed Transcript.
 
         Raises:
             YouTubeTranscriptError: If job fails or times out.
+            ValueError: If a poll interval is not greater than 0.
         """
-        start = time.monotonic()
+        if poll_interval is not None:
+            warnings.warn(
+                "poll_interval is deprecated; use initial_poll_interval and "
+                "max_poll_interval instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            initial_poll_interval = max_poll_interval = poll_interval
+        if initial_poll_interval <= 0 or max_poll_interval <= 0:
+            raise ValueError("poll intervals must be greater than 0")
+
+        interval = min(initial_poll_interval, max_poll_interval)
+        deadline = time.monotonic() + timeout
         while True:
             job = self.get_job(job_id)
             if job.is_complete and job.transcript:
                 return job.transcript
             if job.is_failed:
                 raise YouTubeTranscriptError(
-                    f"ASR job {job_id} failed: {job.raw.get('error', 'unknown')}",
+                    f"ASR job {job_id} failed: {job.error or 'unknown'}",
                     error_code="job_failed",
                 )
-            elapsed = time.monotonic() - start
-            if elapsed > timeout:
+            now = time.monotonic()
+            if now >= deadline:
                 raise YouTubeTranscriptError(
                     f"Timed out waiting for job {job_id} after {timeout}s",
                     error_code="timeout",
                 )
-            time.sleep(poll_interval)
+            # Never sleep past the deadline; the last poll happens right at it.
+            time.sleep(min(interval, deadline - now))
+            interval = min(max_poll_interval, interval * 2)
 
     def batch(
         self,
@@ -222,21 +373,27 @@ class YouTubeTranscript:
 
         Returns:
             BatchResult with completed transcripts and any failures.
+
+        Raises:
+            ValueError: More than 100 entries, or an entry that is not a
+                YouTube URL or video ID.
         """
         if len(video_ids) > 100:
             raise ValueError("Maximum 100 videos per batch request")
 
-        body: Dict[str, Any] = {"video_ids": video_ids}
+        # Reject malformed entries locally rather than failing the whole batch
+        # server-side; sending bare IDs also keeps the request body small.
+        body: Dict[str, Any] = {"video_ids": [parse_video_id(v) for v in video_ids]}
         if language:
             body["language"] = language
 
         data = self._post("/v2/batch", body)
-        return BatchResult.from_response(data)
+        return BatchResult.from_response(data, keep_raw=self._keep_raw)
 
     def get_batch(self, batch_id: str) -> BatchResult:
         """Check status of a batch request."""
         data = self._get(f"/v2/batch/{batch_id}")
-        return BatchResult.from_response(data)
+        return BatchResult.from_response(data, keep_raw=self._keep_raw)
 
     # ─── V1 Endpoints (History & Stats) ──────────────────────────────
 
@@ -270,7 +427,7 @@ class YouTubeTranscript:
         if status:
             params["status"] = status
 
-        return self._get("/v1/history", params=params)
+        return self._get("/v1/history", params=params, cache_ttl=self._cache_ttl)
 
     def get_transcript(
         self,
@@ -298,8 +455,10 @@ class YouTubeTranscript:
         if source:
             params["source"] = source
 
-        data = self._get(f"/v1/transcripts/{video_id}", params=params)
-        return Transcript.from_response(data)
+        data = self._get(
+            f"/v1/transcripts/{video_id}", params=params, cache_ttl=self._cache_ttl
+        )
+        return Transcript.from_response(data, keep_raw=self._keep_raw)
 
     def stats(self) -> AccountStats:
         """
@@ -308,8 +467,8 @@ class YouTubeTranscript:
         Returns:
             AccountStats object.
         """
-        data = self._get("/v1/stats")
-        return AccountStats.from_response(data)
+        data = self._get("/v1/stats", cache_ttl=self._cache_ttl)
+        return AccountStats.from_response(data, keep_raw=self._keep_raw)
 
     def delete_transcript(
         self,
@@ -337,48 +496,93 @@ class YouTubeTranscript:
     # ─── HTTP Layer ──────────────────────────────────────────────────
 
     def _post(self, path: str, body: dict) -> dict:
-        return self._request("POST", path, json=body)
+        # Any write may change history, stats or stored transcripts.
+        self._cache.clear()
+        return self._request("POST", path, content=dumps(body), headers=self._json_headers)
 
-    def _get(self, path: str, params: Optional[dict] = None) -> dict:
-        return self._request("GET", path, params=params)
+    def _get(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> dict:
+        if not cache_ttl:
+            return self._request("GET", path, params=params, headers=self._auth_headers)
+
+        # Cache the body bytes so every hit decodes a fresh dict; results
+        # built from it (``raw``, segment ``words``) are never shared.
+        key = (path, tuple(sorted(params.items())) if params else ())
+        body = self._cache.get(key)
+        if body is None:
+            body = self._request_body("GET", path, params=params, headers=self._auth_headers)
+            self._cache.set(key, body, cache_ttl)
+        return decode_body(body)
 
     def _request(self, method: str, path: str, **kwargs) -> dict:
-        url = f"{self._base_url}{path}"
+        return decode_body(self._request_body(method, path, **kwargs))
+
+    def _request_body(self, method: str, path: str, **kwargs) -> bytes:
         last_exc = None
+        is_idempotent = method in IDEMPOTENT_METHODS
 
         for attempt in range(self._max_retries + 1):
+            if self._rate_limiter is not None:
+                wait = self._rate_limiter.reserve()
+                if wait:
+                    time.sleep(wait)
             try:
-                resp = self._client.request(method, url, **kwargs)
+                # Collect the body into one buffer instead of joining chunks,
+                # and decode bytes directly rather than an intermediate str.
+                with self._client.stream(method, path, **kwargs) as resp:
+                    content = bytearray()
+                    for chunk in resp.iter_bytes():
+                        content += chunk
             except httpx.TimeoutException as e:
                 last_exc = YouTubeTranscriptError(f"Request timed out: {e}")
                 if attempt < self._max_retries:
-                    time.sleep(2 ** attempt)
-                    continue
+                    if is_idempotent or isinstance(e, SAFE_RETRY_TIMEOUTS):
+                        time.sleep(retry_delay(attempt, self._max_backoff) or 0)
+                        continue
+                    logger.debug(
+                        "Not retrying %s %s after %r: not idempotent", method, path, e
+                    )
                 raise last_exc from e
             except httpx.HTTPError as e:
                 raise YouTubeTranscriptError(f"HTTP error: {e}") from e
 
-            # Parse response
+            if resp.is_success:
+                return bytes(content)
+
+            # Parse the error response
             try:
-                data = resp.json()
-            except Exception:
-                if not resp.is_success:
-                    raise YouTubeTranscriptError(
-                        f"Server returned {resp.status_code}: {resp.text[:200]}",
-                        status_code=resp.status_code,
+                data = loads(content)
+            except ValueError:
+                # Gateways answer 429/5xx with plain text or HTML; fall through
+                # so those are still retried and raised by status code.
+                data = {
+                    "message": f"Server returned {resp.status_code}: "
+                    f"{content[:200].decode('utf-8', 'replace')}"
+                }
+
+            # Retry on 429 and 5xx; POSTs only when they were not processed
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if resp.status_code == 429 and retry_after is None:
+                retry_after = parse_retry_after(data.get("retry_after"))
+            if (
+                resp.status_code == 429 or resp.status_code >= 500
+            ) and attempt < self._max_retries:
+                if is_idempotent or resp.status_code in SAFE_RETRY_STATUSES:
+                    delay = retry_delay(attempt, self._max_backoff, retry_after)
+                    if delay is not None:
+                        last_exc = None
+                        time.sleep(delay)
+                        continue
+                else:
+                    logger.debug(
+                        "Not retrying %s %s after %d: not idempotent",
+                        method, path, resp.status_code,
                     )
-                raise YouTubeTranscriptError("Invalid JSON in response")
-
-            # Check for errors
-            if not resp.is_success and resp.status_code not in (202,):
-                # Retry on 5xx
-                if resp.status_code >= 500 and attempt < self._max_retries:
-                    last_exc = None
-                    time.sleep(2 ** attempt)
-                    continue
-                raise_for_status(resp.status_code, data)
-
-            return data
+            raise_for_status(resp.status_code, data, retry_after=retry_after)
 
         if last_exc:
             raise last_exc
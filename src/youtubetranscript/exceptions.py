@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Dict, Optional, Type
 
 
 class YouTubeTranscriptError(Exception):
     """Base exception for all API errors."""
 
+    # Slots on every level keep instances from materialising a __dict__,
+    # which matters when batches collect many errors.
+    __slots__ = ("status_code", "error_code")
+
     def __init__(
         self,
         message: str,
@@ -18,30 +22,42 @@ class YouTubeTranscriptError(Exception):
         self.error_code = error_code
         super().__init__(message)
 
+    def __reduce__(self):
+        # BaseException only pickles __dict__; carry slot values explicitly.
+        state = {
+            name: getattr(self, name)
+            for klass in type(self).__mro__
+            for name in getattr(klass, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
+
 
 class AuthenticationError(YouTubeTranscriptError):
     """Invalid or missing API key (401)."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientCreditsError(YouTubeTranscriptError):
     """Not enough credits for the requested operation (402)."""
-    pass
+    __slots__ = ()
 
 
 class InvalidRequestError(YouTubeTranscriptError):
     """Bad request — invalid parameters or missing fields (400)."""
-    pass
+    __slots__ = ()
 
 
 class NoCaptionsError(YouTubeTranscriptError):
     """Video has no captions and ASR was not requested (404)."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(YouTubeTranscriptError):
     """Too many requests (429). Check retry_after attribute."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str,
@@ -54,39 +70,55 @@ class RateLimitError(YouTubeTranscriptError):
 
 class ServerError(YouTubeTranscriptError):
     """Server-side error (5xx). Safe to retry with backoff."""
-    pass
+    __slots__ = ()
 
 
 # Map HTTP status + error codes to exception classes
-_ERROR_MAP = {
+_ERROR_MAP: Dict[int, Type[YouTubeTranscriptError]] = {
+    400: InvalidRequestError,
     401: AuthenticationError,
     402: InsufficientCreditsError,
     404: NoCaptionsError,
     429: RateLimitError,
+    500: ServerError,
+    502: ServerError,
+    503: ServerError,
+    504: ServerError,
 }
 
 
-def raise_for_status(status_code: int, body: dict) -> None:
-    """Raise the appropriate exception based on API error response."""
-    if 200 <= status_code < 300:
-        return
+def _default_for_range(status_code: int) -> Type[YouTubeTranscriptError]:
+    """Exception class for status codes not listed in _ERROR_MAP."""
+    if status_code >= 500:
+        return ServerError
+    if status_code >= 400:
+        return InvalidRequestError
+    return YouTubeTranscriptError
 
-    message = body.get("message") or body.get("error") or f"API error {status_code}"
-    error_code = body.get("error_code")
 
-    exc_class = _ERROR_MAP.get(status_code)
+def raise_for_status(
+    status_code: int,
+    body: dict,
+    *,
+    retry_after: Optional[float] = None,
+) -> None:
+    """
+    Raise the appropriate exception based on API error response.
 
-    if exc_class is None:
-        if status_code >= 500:
-            exc_class = ServerError
-        elif status_code >= 400:
-            exc_class = InvalidRequestError
-        else:
-            exc_class = YouTubeTranscriptError
+    ``retry_after`` is the parsed ``Retry-After`` header, if any; it takes
+    precedence over a ``retry_after`` field in the body.
+    """
+    if 200 <= status_code < 300:
+        return
 
-    kwargs = {"status_code": status_code, "error_code": error_code}
+    exc_class = _ERROR_MAP.get(status_code) or _default_for_range(status_code)
+    message = body.get("message") or body.get("error") or f"API error {status_code}"
 
     if exc_class is RateLimitError:
-        kwargs["retry_after"] = body.get("retry_after")
-
-    raise exc_class(message, **kwargs)
+        raise RateLimitError(
+            message,
+            retry_after=retry_after if retry_after is not None else body.get("retry_after"),
+            status_code=status_code,
+            error_code=body.get("error_code"),
+        )
+    raise exc_class(message, status_code=status_code, error_code=body.get("error_code"))
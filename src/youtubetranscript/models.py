@@ -2,53 +2,123 @@
 
 from __future__ import annotations
 
+import re
+import sys
+from array import array
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
-
-
-@dataclass
+from functools import lru_cache
+from itertools import accumulate
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+    overload,
+)
+
+from youtubetranscript._utils import loads
+
+# Slotted dataclasses (3.10+) drop the per-instance __dict__, which adds up
+# for transcripts with thousands of segments.
+_DATACLASS_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Below this many segments a per-segment ``in`` beats building a joined index.
+_SEARCH_INDEX_MIN = 32
+
+# The joined-text scan only wins while hits are rare; past this many it hands
+# the rest of the transcript to the per-segment loop.
+_SEARCH_INDEX_MAX_HITS = 32
+
+
+@dataclass(init=False, **_DATACLASS_OPTS)
 class Segment:
     """A single transcript segment with timing."""
 
+    # Hand-written __init__: segments are built by the thousand, and the
+    # generated __init__ plus __post_init__ is measurably slower. Slots come
+    # from the dataclass options (or mypyc) so they never show up as a field.
+
     text: str
     start: float
-    end: float = 0.0
-    duration: float = 0.0
-    words: Optional[List[Dict[str, Any]]] = None
-
-    def __post_init__(self):
-        if self.end == 0.0 and self.duration > 0:
-            self.end = self.start + self.duration
-        if self.duration == 0.0 and self.end > self.start:
-            self.duration = self.end - self.start
+    end: float
+    duration: float
+    words: Optional[List[Dict[str, Any]]]
+
+    def __init__(
+        self,
+        text: str,
+        start: float,
+        end: float = 0.0,
+        duration: float = 0.0,
+        words: Optional[List[Dict[str, Any]]] = None,
+    ):
+        if end == 0.0 and duration > 0:
+            end = start + duration
+        elif duration == 0.0 and end > start:
+            duration = end - start
+        self.text = text
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.words = words
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Explicit so pickling also works when this module is compiled.
+        return (type(self), (self.text, self.start, self.end, self.duration, self.words))
 
     @classmethod
     def from_dict(cls, d: dict) -> "Segment":
         return cls(
-            text=d.get("text", ""),
-            start=float(d.get("start", 0)),
-            end=float(d.get("end", 0)),
-            duration=float(d.get("duration", 0)),
-            words=d.get("words"),
+            d.get("text", ""),
+            float(d.get("start", 0)),
+            float(d.get("end", 0)),
+            float(d.get("duration", 0)),
+            d.get("words"),
         )
 
     @property
     def start_formatted(self) -> str:
         """Format start time as MM:SS."""
-        m, s = divmod(int(self.start), 60)
-        return f"{m:02d}:{s:02d}"
+        return _mmss(int(self.start))
 
     @property
     def start_hms(self) -> str:
         """Format start time as HH:MM:SS."""
-        h, rem = divmod(int(self.start), 3600)
-        m, s = divmod(rem, 60)
-        return f"{h:02d}:{m:02d}:{s:02d}"
+        return _hms(int(self.start))
+
+
+class _DerivedCache:
+    """Base that keeps cached derived data in one slot, out of the dataclass fields."""
+
+    __slots__ = ("_cache",)
+
+    _cache: Dict[str, Any]
+
+    def _derived(self) -> Dict[str, Any]:
+        try:
+            return self._cache
+        except AttributeError:  # first use, or after copy/pickle dropped it
+            cache: Dict[str, Any] = {}
+            self._cache = cache
+            return cache
 
 
-@dataclass
-class Transcript:
-    """A complete video transcript."""
+@dataclass(**_DATACLASS_OPTS)
+class Transcript(_DerivedCache):
+    """
+    A complete video transcript.
+
+    Transcripts are treated as read-mostly: derived data used by
+    ``search``, ``segment_at`` and ``to_plain_text`` is cached on first use
+    and rebuilt when ``segments`` is reassigned or changes length, so edit
+    segment text or start times in place at your own risk.
+    """
 
     video_id: str
     segments: List[Segment] = field(default_factory=list)
@@ -59,8 +129,18 @@ class Transcript:
     raw: Dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_response(cls, data: dict) -> "Transcript":
-        """Parse from API response."""
+    def from_json(cls, data: Union[str, bytes], *, keep_raw: bool = False) -> "Transcript":
+        """Parse a raw JSON response body, decoding with orjson when installed."""
+        return cls.from_response(loads(data), keep_raw=keep_raw)
+
+    @classmethod
+    def from_response(cls, data: dict, *, keep_raw: bool = False) -> "Transcript":
+        """
+        Parse from API response.
+
+        The decoded response is kept in ``raw`` only with ``keep_raw=True``;
+        otherwise ``raw`` is empty so the full payload can be freed.
+        """
         # Handle nested structures: data.data.transcript.segments, data.data.segments, etc.
         inner = data.get("data", data)
         transcript_obj = inner.get("transcript", inner)
@@ -80,25 +160,36 @@ class Transcript:
         if not raw_segments:
             raw_segments = inner.get("segments", [])
 
-        segments = [Segment.from_dict(s) for s in raw_segments]
+        segments = _parse_segments(raw_segments)
 
         # Build full text if not provided
+        plain_text = None
         if not full_text and segments:
-            full_text = " ".join(s.text for s in segments)
+            full_text = plain_text = " ".join(s.text for s in segments)
 
-        return cls(
-            video_id=inner.get("video_id", data.get("video_id", "")),
+        transcript = cls(
+            video_id=inner["video_id"] if "video_id" in inner else data.get("video_id", ""),
             segments=segments,
             text=full_text,
-            language=inner.get("language", data.get("language", "")),
+            language=inner["language"] if "language" in inner else data.get("language", ""),
             status=data.get("status", "completed"),
             request_id=data.get("request_id", ""),
-            raw=data,
+            raw=data if keep_raw else {},
         )
+        if plain_text is not None:
+            transcript._derived()["plain_text"] = (segments, len(segments), plain_text)
+        return transcript
 
     @property
     def word_count(self) -> int:
-        return len(self.text.split()) if self.text else 0
+        text = self.text
+        cache = self._derived()
+        cached = cache.get("word_count")
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        count = len(text.split())
+        cache["word_count"] = (text, count)
+        return count
 
     @property
     def duration(self) -> float:
@@ -108,42 +199,163 @@ class Transcript:
         last = self.segments[-1]
         return last.end if last.end > 0 else last.start + last.duration
 
+    def segment_at(self, seconds: float) -> Optional[Segment]:
+        """
+        Segment being spoken at ``seconds``, or None outside any segment.
+
+        Assumes segments are ordered by start time, as the API returns them.
+        """
+        segments = self.segments
+        cache = self._derived()
+        cached = cache.get("starts")
+        if cached is not None and cached[0] is segments and len(cached[1]) == len(segments):
+            starts = cached[1]
+        else:
+            starts = array("d", [s.start for s in segments])
+            cache["starts"] = (segments, starts)
+        i = bisect_right(starts, seconds) - 1
+        if i < 0:
+            return None
+        seg = segments[i]
+        if seg.end > seg.start and seconds >= seg.end:
+            return None
+        return seg
+
     def to_plain_text(self) -> str:
         """Export as plain text without timestamps."""
-        return " ".join(s.text for s in self.segments)
+        segments = self.segments
+        cache = self._derived()
+        cached = cache.get("plain_text")
+        if cached is not None and cached[0] is segments and cached[1] == len(segments):
+            return cached[2]
+        text = " ".join(s.text for s in segments)
+        cache["plain_text"] = (segments, len(segments), text)
+        return text
 
     def to_timestamped_text(self) -> str:
         """Export as text with timestamps."""
-        lines = []
-        for s in self.segments:
-            lines.append(f"[{s.start_formatted}] {s.text}")
-        return "\n".join(lines)
-
-    def to_srt(self) -> str:
-        """Export as SRT subtitle format."""
-        lines = []
-        for i, s in enumerate(self.segments, 1):
-            start = _srt_time(s.start)
-            end = _srt_time(s.end if s.end > 0 else s.start + max(s.duration, 2.0))
-            lines.append(f"{i}\n{start} --> {end}\n{s.text}\n")
-        return "\n".join(lines)
-
-    def to_vtt(self) -> str:
-        """Export as WebVTT subtitle format."""
-        lines = ["WEBVTT", ""]
-        for s in self.segments:
-            start = _vtt_time(s.start)
-            end = _vtt_time(s.end if s.end > 0 else s.start + max(s.duration, 2.0))
-            lines.append(f"{start} --> {end}\n{s.text}\n")
-        return "\n".join(lines)
+        mmss = _mmss
+        return "\n".join(f"[{mmss(int(s.start))}] {s.text}" for s in self.segments)
+
+    @overload
+    def to_srt(self) -> str: ...
+
+    @overload
+    def to_srt(self, out: IO[str]) -> None: ...
+
+    def to_srt(self, out: Optional[IO[str]] = None) -> Optional[str]:
+        """
+        Export as SRT subtitle format.
+
+        With ``out``, cues are written to that text stream as they are
+        formatted and nothing is returned, so very long transcripts are
+        never held in memory as one string.
+        """
+        cues = self._srt_cues()
+        if out is None:
+            return "\n".join(cues)
+        write = out.write
+        sep = ""
+        for cue in cues:
+            write(sep)
+            write(cue)
+            sep = "\n"
+        return None
+
+    @overload
+    def to_vtt(self) -> str: ...
+
+    @overload
+    def to_vtt(self, out: IO[str]) -> None: ...
+
+    def to_vtt(self, out: Optional[IO[str]] = None) -> Optional[str]:
+        """Export as WebVTT subtitle format, optionally streamed to ``out``."""
+        if out is None:
+            if not self.segments:
+                return "WEBVTT\n"
+            return "WEBVTT\n\n" + "\n".join(self._vtt_cues())
+        write = out.write
+        write("WEBVTT\n")
+        for cue in self._vtt_cues():
+            write("\n")
+            write(cue)
+        return None
+
+    def _srt_cues(self) -> Iterator[str]:
+        srt_time = _srt_time
+        return (
+            f"{i}\n{srt_time(s.start)} --> "
+            f"{srt_time(s.end if s.end > 0 else s.start + max(s.duration, 2.0))}\n{s.text}\n"
+            for i, s in enumerate(self.segments, 1)
+        )
+
+    def _vtt_cues(self) -> Iterator[str]:
+        vtt_time = _vtt_time
+        return (
+            f"{vtt_time(s.start)} --> "
+            f"{vtt_time(s.end if s.end > 0 else s.start + max(s.duration, 2.0))}\n{s.text}\n"
+            for s in self.segments
+        )
 
     def search(self, query: str) -> List[Segment]:
         """Find segments containing the query text (case-insensitive)."""
-        q = query.lower()
-        return [s for s in self.segments if q in s.text.lower()]
-
-
-@dataclass
+        q = query.casefold()
+        segments = self.segments
+        cache = self._derived()
+        cached = cache.get("folded")
+        if cached is not None and cached[0] is segments and len(cached[1]) == len(segments):
+            folded = cached[1]
+        else:
+            fold = str.casefold
+            folded = [fold(s.text) for s in segments]
+            cache["folded"] = (segments, folded)
+            cache.pop("folded_index", None)
+        if not q or len(folded) < _SEARCH_INDEX_MIN:
+            return [segments[i] for i, text in enumerate(folded) if q in text]
+        return [segments[i] for i in self._find_segments(q, folded, cache)]
+
+    def search_regex(self, pattern: Union[str, Pattern[str]]) -> List[Segment]:
+        """
+        Find segments whose text matches a regular expression.
+
+        String patterns are compiled case-insensitively; compiled patterns
+        are used with their own flags.
+        """
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern, re.IGNORECASE)
+        search = pattern.search
+        return [s for s in self.segments if search(s.text)]
+
+    @staticmethod
+    def _find_segments(q: str, folded: List[str], cache: Dict[str, Any]) -> List[int]:
+        """Indices of segments containing ``q``, via one scan of the joined text."""
+        index = cache.get("folded_index")
+        if index is None:
+            starts = list(accumulate((len(t) + 1 for t in folded[:-1]), initial=0))
+            index = cache["folded_index"] = ("\0".join(folded), starts)
+        joined, starts = index
+        find = joined.find
+        last = len(starts) - 1
+        n = len(q)
+        hits = []
+        pos = find(q)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            if pos + n <= starts[i] + len(folded[i]):
+                hits.append(i)
+                if i == last:
+                    break
+                if len(hits) > _SEARCH_INDEX_MAX_HITS:
+                    hits.extend([j for j in range(i + 1, last + 1) if q in folded[j]])
+                    break
+                pos = find(q, starts[i + 1])
+            else:
+                # Match runs across a segment boundary; keep scanning.
+                pos = find(q, pos + 1)
+        return hits
+
+
+@dataclass(**_DATACLASS_OPTS)
 class TranscriptJob:
     """An async ASR transcription job."""
 
@@ -152,19 +364,24 @@ class TranscriptJob:
     video_id: str = ""
     transcript: Optional[Transcript] = None
     raw: Dict[str, Any] = field(default_factory=dict, repr=False)
+    error: Optional[str] = None
 
     @classmethod
-    def from_response(cls, data: dict) -> "TranscriptJob":
+    def from_response(cls, data: dict, *, keep_raw: bool = False) -> "TranscriptJob":
         transcript = None
         if data.get("status") == "completed":
-            transcript = Transcript.from_response(data)
+            transcript = Transcript.from_response(data, keep_raw=keep_raw)
 
         return cls(
-            job_id=data.get("job_id", data.get("request_id", "")),
+            job_id=data["job_id"] if "job_id" in data else data.get("request_id", ""),
             status=data.get("status", "unknown"),
-            video_id=data.get("video_id", data.get("data", {}).get("video_id", "")),
+            video_id=(
+                data["video_id"] if "video_id" in data
+                else data.get("data", {}).get("video_id", "")
+            ),
             transcript=transcript,
-            raw=data,
+            raw=data if keep_raw else {},
+            error=data.get("error"),
         )
 
     @property
@@ -180,7 +397,7 @@ class TranscriptJob:
         return self.status == "failed"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class BatchResult:
     """Result of a batch transcription request."""
 
@@ -191,22 +408,23 @@ class BatchResult:
     raw: Dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_response(cls, data: dict) -> "BatchResult":
-        completed = []
-        for item in data.get("completed", data.get("data", [])):
-            if isinstance(item, dict):
-                completed.append(Transcript.from_response(item))
+    def from_response(cls, data: dict, *, keep_raw: bool = False) -> "BatchResult":
+        items = data["completed"] if "completed" in data else data.get("data", [])
+        parse = Transcript.from_response
+        completed = [
+            parse(item, keep_raw=keep_raw) for item in items if isinstance(item, dict)
+        ]
 
         return cls(
             batch_id=data.get("batch_id", ""),
             status=data.get("status", "completed"),
             completed=completed,
             failed=data.get("failed", []),
-            raw=data,
+            raw=data if keep_raw else {},
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class AccountStats:
     """Account usage statistics."""
 
@@ -217,27 +435,67 @@ class AccountStats:
     raw: Dict[str, Any] = field(default_factory=dict, repr=False)
 
     @classmethod
-    def from_response(cls, data: dict) -> "AccountStats":
+    def from_response(cls, data: dict, *, keep_raw: bool = False) -> "AccountStats":
         return cls(
-            credits_remaining=data.get("credits_remaining", data.get("credits_left", 0)),
+            credits_remaining=(
+                data["credits_remaining"] if "credits_remaining" in data
+                else data.get("credits_left", 0)
+            ),
             credits_used=data.get("credits_used", 0),
             transcripts_created=data.get("transcripts_created", 0),
             plan=data.get("plan", ""),
-            raw=data,
+            raw=data if keep_raw else {},
         )
 
 
+def _parse_segments(raw_segments: List[Dict[str, Any]]) -> List[Segment]:
+    """Segment.from_dict inlined into one comprehension for whole transcripts."""
+    make = Segment
+    to_float = float
+    return [
+        make(
+            d.get("text", ""),
+            to_float(d.get("start", 0)),
+            to_float(d.get("end", 0)),
+            to_float(d.get("duration", 0)),
+            d.get("words"),
+        )
+        for d in raw_segments
+    ]
+
+
+# Zero-padded fields, so timestamps are built by concatenation instead of
+# per-call format specs. Out-of-range values fall back to formatting.
+_TWO = tuple(f"{i:02d}" for i in range(100))
+_THREE = tuple(f"{i:03d}" for i in range(1000))
+
+
+def _mmss(total: int) -> str:
+    """Format whole seconds as MM:SS."""
+    m, s = divmod(total, 60)
+    return (_TWO[m] if 0 <= m < 100 else f"{m:02d}") + ":" + _TWO[s]
+
+
+def _hms(total: int) -> str:
+    """Format whole seconds as HH:MM:SS."""
+    h, rem = divmod(total, 3600)
+    m, s = divmod(rem, 60)
+    return (_TWO[h] if 0 <= h < 100 else f"{h:02d}") + ":" + _TWO[m] + ":" + _TWO[s]
+
+
+# Exports format every start/end twice and are often repeated, so the
+# formatted timestamps are memoised on the exact float value.
+@lru_cache(maxsize=8192)
 def _srt_time(seconds: float) -> str:
     """Format seconds as SRT timestamp: HH:MM:SS,mmm"""
-    h, rem = divmod(int(seconds), 3600)
-    m, s = divmod(rem, 60)
-    ms = int((seconds - int(seconds)) * 1000)
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    total = int(seconds)
+    ms = int((seconds - total) * 1000)
+    return _hms(total) + "," + (_THREE[ms] if ms >= 0 else f"{ms:03d}")
 
 
+@lru_cache(maxsize=8192)
 def _vtt_time(seconds: float) -> str:
     """Format seconds as VTT timestamp: HH:MM:SS.mmm"""
-    h, rem = divmod(int(seconds), 3600)
-    m, s = divmod(rem, 60)
-    ms = int((seconds - int(seconds)) * 1000)
-    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+    total = int(seconds)
+    ms = int((seconds - total) * 1000)
+    return _hms(total) + "." + (_THREE[ms] if ms >= 0 else f"{ms:03d}")
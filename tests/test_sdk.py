@@ -1,9 +1,25 @@
 """Tests for the YouTubeTranscript SDK."""
 
+import asyncio
+import gc
+import json
+import pickle
+import sys
+import threading
+
+import httpx
 import pytest
-from youtubetranscript.models import Segment, Transcript, TranscriptJob, AccountStats
+import respx
+from youtubetranscript import AsyncYouTubeTranscript, YouTubeTranscript
+from youtubetranscript._utils import (
+    TokenBucket, TTLCache, parse_retry_after, parse_video_id, retry_delay,
+)
+from youtubetranscript.models import (
+    Segment, Transcript, TranscriptJob, BatchResult, AccountStats,
+)
 from youtubetranscript.exceptions import (
     raise_for_status,
+    YouTubeTranscriptError,
     AuthenticationError,
     NoCaptionsError,
     RateLimitError,
@@ -35,6 +51,49 @@ class TestSegment:
         s = Segment(text="", start=3725.0)
         assert s.start_hms == "01:02:05"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_slotted_and_picklable(self):
+        s = Segment(text="Hi", start=1.0, end=2.0)
+        assert not hasattr(s, "__dict__")
+        assert pickle.loads(pickle.dumps(s)) == s
+
+    def test_dataclass_fields_and_repr(self):
+        from dataclasses import asdict, fields
+
+        s = Segment(text="a", start=1.0, end=2.0)
+        assert [f.name for f in fields(Segment)] == ["text", "start", "end", "duration", "words"]
+        assert repr(s) == "Segment(text='a', start=1.0, end=2.0, duration=1.0, words=None)"
+        assert asdict(s) == {
+            "text": "a", "start": 1.0, "end": 2.0, "duration": 1.0, "words": None,
+        }
+
+    def test_from_dict_matches_constructor(self):
+        for d in (
+            {"text": "a", "start": 1, "end": 3},
+            {"text": "b", "start": 1, "duration": 2},
+            {"text": "c", "start": 4, "end": 3},
+            {"text": "d", "start": 1, "end": 5, "duration": 2, "words": [{"w": "d"}]},
+            {},
+        ):
+            expected = Segment(
+                text=d.get("text", ""),
+                start=float(d.get("start", 0)),
+                end=float(d.get("end", 0)),
+                duration=float(d.get("duration", 0)),
+                words=d.get("words"),
+            )
+            assert Segment.from_dict(d) == expected
+
+    def test_formatting_past_99(self):
+        s = Segment(text="", start=360125.0)
+        assert s.start_formatted == "6002:05"
+        assert s.start_hms == "100:02:05"
+
+    def test_constructor_normalises_timings(self):
+        assert Segment("a", 1.0, duration=2.0).end == 3.0
+        assert Segment("a", 1.0, end=4.0).duration == 3.0
+        assert Segment("a", 1.0, 5.0, 2.0) == Segment(text="a", start=1.0, end=5.0, duration=2.0)
+
 
 class TestTranscript:
     def test_from_response_nested(self):
@@ -121,6 +180,188 @@ class TestTranscript:
         )
         assert t.duration == 10.0
 
+    def test_repeated_export_reuses_formatted_timestamps(self):
+        from youtubetranscript.models import _srt_time
+
+        t = Transcript(video_id="x", segments=[Segment(text="a", start=7201.25, end=7202.5)])
+        first = t.to_srt()
+        hits = _srt_time.cache_info().hits
+        assert t.to_srt() == first
+        assert _srt_time.cache_info().hits == hits + 2
+
+    def test_export_layout(self):
+        t = Transcript(
+            video_id="x",
+            segments=[Segment(text="a", start=0, end=1), Segment(text="b", start=1, end=2)],
+        )
+        assert t.to_srt() == (
+            "1\n00:00:00,000 --> 00:00:01,000\na\n\n2\n00:00:01,000 --> 00:00:02,000\nb\n"
+        )
+        assert t.to_vtt() == (
+            "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\na\n\n00:00:01.000 --> 00:00:02.000\nb\n"
+        )
+        assert Transcript(video_id="x").to_srt() == ""
+        assert Transcript(video_id="x").to_vtt() == "WEBVTT\n"
+
+    def test_search_cache_follows_appended_segments(self):
+        t = Transcript(video_id="x", segments=[Segment(text="Hello", start=0)])
+        assert len(t.search("hello")) == 1
+        t.segments.append(Segment(text="HELLO again", start=1))
+        assert [s.start for s in t.search("hello")] == [0, 1]
+        assert t == Transcript(video_id="x", segments=list(t.segments))
+
+    def test_search_cache_follows_reassigned_segments(self):
+        for n in (2, 40):
+            t = Transcript(video_id="x", segments=[Segment(text="old", start=i) for i in range(n)])
+            assert len(t.search("old")) == n
+            t.segments = [Segment(text="new", start=i) for i in range(n)]
+            assert t.search("old") == []
+            assert len(t.search("new")) == n
+
+    def test_search_long_transcript(self):
+        texts = ["alpha beta", "gamma", "Beta Beta", "delta"] * 10
+        t = Transcript(
+            video_id="x", segments=[Segment(text=s, start=i) for i, s in enumerate(texts)]
+        )
+        assert [s.start for s in t.search("beta")] == [
+            i for i, s in enumerate(texts) if "beta" in s.lower()
+        ]
+        # Matches may not straddle two segments.
+        assert t.search("betagamma") == []
+        assert t.search("a\0g") == []
+
+    def test_search_many_hits_in_long_transcript(self):
+        texts = ["the cat", "a dog", "the end", "theme", "other"] * 30
+        t = Transcript(
+            video_id="x", segments=[Segment(text=s, start=i) for i, s in enumerate(texts)]
+        )
+        assert [s.start for s in t.search("the")] == [
+            i for i, s in enumerate(texts) if "the" in s
+        ]
+
+    def test_word_count_tracks_text(self):
+        t = Transcript(video_id="x", text="one  two\tthree\n")
+        assert t.word_count == 3
+        t.text = "just one more"
+        assert t.word_count == 3
+        t.text = ""
+        assert t.word_count == 0
+
+    def test_parsed_segments_match_from_dict(self):
+        raw = [
+            {"text": "a", "start": 0, "end": 1},
+            {"text": "b", "start": 1, "duration": 2},
+            {"text": "c", "start": "3.5", "words": [{"word": "c"}]},
+        ]
+        t = Transcript.from_response({"segments": raw})
+        assert t.segments == [Segment.from_dict(d) for d in raw]
+
+    def test_segment_at(self):
+        t = Transcript(
+            video_id="x",
+            segments=[
+                Segment(text="a", start=1.0, end=2.0),
+                Segment(text="b", start=2.0, end=3.5),
+                Segment(text="c", start=5.0, duration=1.0),
+            ],
+        )
+        assert t.segment_at(0.5) is None
+        assert t.segment_at(1.0).text == "a"
+        assert t.segment_at(2.0).text == "b"
+        assert t.segment_at(4.0) is None
+        assert t.segment_at(5.5).text == "c"
+        assert t.segment_at(6.0) is None
+        t.segments.append(Segment(text="d", start=6.0, end=7.0))
+        assert t.segment_at(6.0).text == "d"
+        t.segments = [Segment(text=c, start=10.0 + i, end=11.0 + i) for i, c in enumerate("wxyz")]
+        assert t.segment_at(6.0) is None
+        assert t.segment_at(12.5).text == "y"
+
+    def test_from_json(self):
+        body = json.dumps({"data": {"video_id": "v", "segments": [{"text": "hi", "start": 0}]}})
+        for raw in (body, body.encode()):
+            t = Transcript.from_json(raw)
+            assert t.video_id == "v"
+            assert t.text == "hi"
+
+    def test_plain_text_reuses_joined_text(self):
+        raw = [{"text": "a", "start": 0}, {"text": "b", "start": 1}]
+        t = Transcript.from_response({"segments": raw})
+        assert t.to_plain_text() is t.text
+        t.segments.append(Segment(text="c", start=2))
+        assert t.to_plain_text() == "a b c"
+        t.segments = [Segment(text=c, start=i) for i, c in enumerate("xyz")]
+        assert t.to_plain_text() == "x y z"
+        # Server-provided text may differ from the segment join.
+        t = Transcript.from_response({"text": "A. B.", "segments": [{"text": "a", "start": 0}]})
+        assert t.to_plain_text() == "a"
+
+    def test_search_casefolds(self):
+        t = Transcript(video_id="x", segments=[Segment(text="Die Straße", start=0)])
+        assert len(t.search("STRASSE")) == 1
+
+    def test_search_regex(self):
+        import re
+
+        t = Transcript(
+            video_id="x",
+            segments=[Segment(text="Python rocks", start=0), Segment(text="pythonic", start=1)],
+        )
+        assert [s.start for s in t.search_regex(r"\bpython\b")] == [0]
+        assert [s.start for s in t.search_regex(re.compile("python"))] == [1]
+
+    def test_duration_follows_segment_edits(self):
+        t = Transcript.from_response({"segments": [{"text": "a", "start": 0, "duration": 2}]})
+        assert t.duration == 2.0
+        t.segments.append(Segment(text="b", start=3, duration=4))
+        assert t.duration == 7.0
+        t.segments[-1].end = 99
+        assert t.duration == 99
+        t.segments = [Segment(text="c", start=0, duration=1), Segment(text="d", start=1)]
+        assert t.duration == 1.0
+        assert Transcript(video_id="x").duration == 0.0
+
+    def test_raw_kept_only_on_request(self):
+        data = {"video_id": "v", "segments": [{"text": "a", "start": 0}]}
+        assert Transcript.from_response(data).raw == {}
+        assert Transcript.from_response(data, keep_raw=True).raw is data
+
+    def test_to_timestamped_text(self):
+        t = Transcript(
+            video_id="x",
+            segments=[Segment(text="Hello", start=5.9), Segment(text="again", start=6125.0)],
+        )
+        assert t.to_timestamped_text() == "[00:05] Hello\n[102:05] again"
+        assert Transcript(video_id="x").to_timestamped_text() == ""
+
+    def test_export_to_stream(self):
+        import io
+
+        t = Transcript(
+            video_id="x",
+            segments=[Segment(text="a", start=0, end=1), Segment(text="b", start=1, end=2)],
+        )
+        for export in (t.to_srt, t.to_vtt):
+            buf = io.StringIO()
+            assert export(buf) is None
+            assert buf.getvalue() == export()
+
+    def test_caches_stay_out_of_dataclass_fields(self):
+        from dataclasses import asdict, fields
+
+        data = {"video_id": "v", "segments": [{"text": "Hi", "start": 0}]}
+        t = Transcript.from_response(data)
+        t.search("hi"), t.segment_at(0), t.to_plain_text(), t.word_count
+        assert [f.name for f in fields(Transcript)] == [
+            "video_id", "segments", "text", "language", "status", "request_id", "raw",
+        ]
+        assert json.loads(json.dumps(asdict(t)))["segments"][0]["text"] == "Hi"
+        assert "_cache" not in repr(t)
+        assert t == Transcript.from_response(data)
+        restored = pickle.loads(pickle.dumps(t))
+        assert restored == t
+        assert restored.segment_at(0).text == "Hi"
+
 
 class TestTranscriptJob:
     def test_processing_job(self):
@@ -148,6 +389,31 @@ class TestTranscriptJob:
         assert j.transcript is not None
         assert len(j.transcript.segments) == 1
 
+    def test_fallback_keys_only_read_when_needed(self):
+        j = TranscriptJob.from_response({
+            "request_id": "r1",
+            "status": "queued",
+            "video_id": "vid1",
+            "data": [],
+        })
+        assert j.job_id == "r1"
+        assert j.video_id == "vid1"
+
+
+class TestBatchResult:
+    def test_from_response_skips_non_dict_items(self):
+        b = BatchResult.from_response({
+            "batch_id": "b1",
+            "completed": [
+                {"video_id": "v1", "segments": [{"text": "a", "start": 0}]},
+                "v2",
+                {"video_id": "v3"},
+            ],
+            "failed": [{"video_id": "v4", "error": "no captions"}],
+        })
+        assert [t.video_id for t in b.completed] == ["v1", "v3"]
+        assert b.failed[0]["video_id"] == "v4"
+
 
 class TestAccountStats:
     def test_from_response(self):
@@ -189,5 +455,547 @@ class TestExceptions:
         with pytest.raises(ServerError):
             raise_for_status(500, {"message": "Internal error"})
 
+    def test_unlisted_codes_fall_back_by_range(self):
+        with pytest.raises(InvalidRequestError):
+            raise_for_status(422, {})
+        with pytest.raises(ServerError) as exc_info:
+            raise_for_status(599, {})
+        assert str(exc_info.value) == "API error 599"
+
+    def test_errors_have_no_instance_dict_and_pickle(self):
+        err = RateLimitError("slow down", retry_after=5, status_code=429)
+        assert not hasattr(err, "__dict__") or not err.__dict__
+        restored = pickle.loads(pickle.dumps(err))
+        assert restored.retry_after == 5
+        assert restored.status_code == 429
+
     def test_200_does_not_raise(self):
         raise_for_status(200, {})  # should not raise
+
+
+# ─── HTTP Layer Tests ────────────────────────────────────────────────
+
+API = "https://youtubetranscript.dev/api"
+
+
+class TestRetry:
+    def test_retry_delay_is_capped(self):
+        for attempt in range(10):
+            assert 0 <= retry_delay(attempt, 5.0) <= 5.0
+
+    def test_retry_delay_honors_retry_after(self):
+        assert retry_delay(0, 30.0, retry_after=7.0) == 7.0
+        assert retry_delay(0, 30.0, retry_after=60.0) is None
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after("12") == 12.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    @respx.mock
+    def test_retries_5xx(self):
+        route = respx.get(f"{API}/v1/stats").mock(side_effect=[
+            httpx.Response(503, json={"message": "busy"}, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"credits_remaining": 5}),
+        ])
+        with YouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            assert yt.stats().credits_remaining == 5
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_retries_429_after_header_delay(self):
+        route = respx.get(f"{API}/v1/stats").mock(side_effect=[
+            httpx.Response(429, json={"message": "slow down"}, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"credits_remaining": 5}),
+        ])
+        with YouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            assert yt.stats().credits_remaining == 5
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_429_exposes_header_retry_after(self):
+        respx.get(f"{API}/v1/stats").mock(return_value=httpx.Response(
+            429, json={"message": "slow down"}, headers={"Retry-After": "120"},
+        ))
+        with YouTubeTranscript("test_api_key") as yt:
+            with pytest.raises(RateLimitError) as exc_info:
+                yt.stats()
+        assert exc_info.value.retry_after == 120.0
+
+    @respx.mock
+    def test_plain_text_429_is_retried_then_raised(self):
+        route = respx.get(f"{API}/v1/stats").mock(return_value=httpx.Response(
+            429, text="Too Many Requests", headers={"Retry-After": "0"},
+        ))
+        with YouTubeTranscript("test_api_key", max_retries=2, max_backoff=0) as yt:
+            with pytest.raises(RateLimitError) as exc_info:
+                yt.stats()
+        assert route.call_count == 3
+        assert exc_info.value.retry_after == 0.0
+        assert "Too Many Requests" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_plain_text_429_is_retried(self):
+        route = respx.get(f"{API}/v1/stats").mock(side_effect=[
+            httpx.Response(429, text="Too Many Requests", headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"credits_remaining": 5}),
+        ])
+        async with AsyncYouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            assert (await yt.stats()).credits_remaining == 5
+        assert route.call_count == 2
+
+
+class TestAsyncClient:
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_transcribe_many_keeps_order_and_errors(self):
+        def reply(request):
+            video = json.loads(request.content)["video"]
+            if video == "bad":
+                return httpx.Response(404, json={"message": "No captions"})
+            return httpx.Response(200, json={"data": {"video_id": video}})
+
+        respx.post(f"{API}/v2/transcribe").mock(side_effect=reply)
+        async with AsyncYouTubeTranscript("test_api_key") as yt:
+            results = await yt.transcribe_many(["a", "bad", "c"], concurrency=2)
+        assert results[0].video_id == "a"
+        assert isinstance(results[1], NoCaptionsError)
+        assert results[2].video_id == "c"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_list_transcripts_params(self):
+        route = respx.get(f"{API}/v1/history").mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+        async with AsyncYouTubeTranscript("test_api_key") as yt:
+            await yt.list_transcripts(search="python", limit=5)
+        assert dict(route.calls.last.request.url.params) == {
+            "limit": "5", "page": "1", "search": "python",
+        }
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_transcribe_many_fail_fast(self):
+        respx.post(f"{API}/v2/transcribe").mock(
+            return_value=httpx.Response(404, json={"message": "No captions"})
+        )
+        async with AsyncYouTubeTranscript("test_api_key") as yt:
+            with pytest.raises(NoCaptionsError):
+                await yt.transcribe_many(["a", "b"], return_exceptions=False)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_identical_concurrent_requests_coalesce(self):
+        route = respx.post(f"{API}/v2/transcribe").mock(
+            return_value=httpx.Response(200, json={"data": {"video_id": "a"}})
+        )
+        async with AsyncYouTubeTranscript("test_api_key") as yt:
+            results = await asyncio.gather(
+                yt.transcribe("a"), yt.transcribe("a"), yt.transcribe("a")
+            )
+            assert route.call_count == 1
+            await yt.transcribe("a")
+        assert route.call_count == 2
+        assert all(r.video_id == "a" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_close_is_idempotent(self):
+        yt = AsyncYouTubeTranscript("test_api_key")
+        await yt.close()
+        await yt.close()
+        assert yt._client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_gc_closes_on_owning_loop(self):
+        yt = AsyncYouTubeTranscript("test_api_key")
+        client = yt._client
+        del yt
+        gc.collect()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert client.is_closed
+
+    def test_gc_ignores_foreign_loop(self):
+        async def make():
+            return AsyncYouTubeTranscript("test_api_key")
+
+        yt = asyncio.run(make())
+        client = yt._client
+
+        async def collect():
+            nonlocal yt
+            del yt
+            gc.collect()
+            await asyncio.sleep(0)
+            return len(asyncio.all_tasks())
+
+        assert asyncio.run(collect()) == 1
+        assert not client.is_closed
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_cancelling_last_waiter_cancels_request(self):
+        started = asyncio.Event()
+        cancelled = []
+
+        async def slow(request):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+            return httpx.Response(200, json={"data": {"video_id": "a"}})
+
+        respx.post(f"{API}/v2/transcribe").mock(side_effect=slow)
+        async with AsyncYouTubeTranscript("test_api_key") as yt:
+            first = asyncio.ensure_future(yt.transcribe("a"))
+            second = asyncio.ensure_future(yt.transcribe("a"))
+            await started.wait()
+            first.cancel()
+            await asyncio.sleep(0)
+            assert yt._inflight  # still wanted by the second caller
+            second.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await second
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert not yt._inflight
+        assert len(cancelled) == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_transcribe_many_fail_fast_cancels_slow_peers(self):
+        cancelled = []
+
+        async def respond(request):
+            video = json.loads(request.content)["video"]
+            if video == "bad":
+                return httpx.Response(404, json={"message": "No captions"})
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(video)
+                raise
+            return httpx.Response(200, json={"data": {"video_id": video}})
+
+        respx.post(f"{API}/v2/transcribe").mock(side_effect=respond)
+        async with AsyncYouTubeTranscript("test_api_key") as yt:
+            with pytest.raises(NoCaptionsError):
+                await yt.transcribe_many(["slow1", "slow2", "bad"], return_exceptions=False)
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert not yt._inflight
+        assert sorted(cancelled) == ["slow1", "slow2"]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_coalesced_results_are_not_shared(self):
+        respx.post(f"{API}/v2/transcribe").mock(return_value=httpx.Response(200, json={
+            "data": {"video_id": "a", "segments": [{"text": "hi", "start": 0, "words": []}]},
+        }))
+        async with AsyncYouTubeTranscript("test_api_key", keep_raw=True) as yt:
+            a, b = await asyncio.gather(yt.transcribe("a"), yt.transcribe("a"))
+        assert a.raw == b.raw and a.raw is not b.raw
+        assert a.segments[0].words is not b.segments[0].words
+        a.raw["data"]["video_id"] = "changed"
+        assert b.raw["data"]["video_id"] == "a"
+
+
+class TestResponseCache:
+    @respx.mock
+    def test_stats_cached_until_write(self):
+        stats = respx.get(f"{API}/v1/stats").mock(
+            return_value=httpx.Response(200, json={"credits_remaining": 5})
+        )
+        respx.post(f"{API}/v1/transcripts/bulk-delete").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        with YouTubeTranscript("test_api_key") as yt:
+            yt.stats()
+            yt.stats()
+            assert stats.call_count == 1
+            yt.delete_transcript(video_id="x")
+            yt.stats()
+            assert stats.call_count == 2
+
+    @respx.mock
+    def test_cache_disabled(self):
+        stats = respx.get(f"{API}/v1/stats").mock(
+            return_value=httpx.Response(200, json={"credits_remaining": 5})
+        )
+        with YouTubeTranscript("test_api_key", cache_ttl=0) as yt:
+            yt.stats()
+            yt.stats()
+        assert stats.call_count == 2
+
+    @respx.mock
+    def test_transcribe_disk_cache(self, tmp_path):
+        route = respx.post(f"{API}/v2/transcribe").mock(return_value=httpx.Response(200, json={
+            "status": "completed",
+            "data": {"video_id": "dQw4w9WgXcQ", "segments": [{"text": "hi", "start": 0}]},
+        }))
+        with YouTubeTranscript("test_api_key", cache_dir=tmp_path) as yt:
+            yt.transcribe("dQw4w9WgXcQ", language="es")
+            cached = yt.transcribe("dQw4w9WgXcQ", language="es")
+            assert route.call_count == 1
+            assert cached.segments[0].text == "hi"
+            yt.transcribe("dQw4w9WgXcQ", language="es", no_cache=True)
+            yt.transcribe("dQw4w9WgXcQ", language="fr")
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_client_keep_raw(self):
+        body = {"status": "completed", "data": {"video_id": "v", "segments": []}}
+        respx.post(f"{API}/v2/transcribe").mock(return_value=httpx.Response(200, json=body))
+        with YouTubeTranscript("test_api_key") as yt:
+            assert yt.transcribe("dQw4w9WgXcQ").raw == {}
+        with YouTubeTranscript("test_api_key", keep_raw=True) as yt:
+            assert yt.transcribe("dQw4w9WgXcQ").raw == body
+
+    @respx.mock
+    def test_cached_raw_not_shared(self):
+        respx.get(f"{API}/v1/stats").mock(
+            return_value=httpx.Response(200, json={"credits_remaining": 5})
+        )
+        with YouTubeTranscript("test_api_key", keep_raw=True) as yt:
+            yt.stats().raw["credits_remaining"] = 0
+            first = yt.stats()
+            first.raw["credits_remaining"] = 1
+            assert yt.stats().raw == {"credits_remaining": 5}
+
+    def test_ttl_cache_concurrent_eviction(self):
+        cache = TTLCache(max_entries=4)
+        errors = []
+
+        def hammer(offset):
+            try:
+                for i in range(2000):
+                    cache.set((offset + i) % 8, i, 0 if i % 3 else 60)
+                    cache.get((offset + i + 1) % 8)
+            except Exception as exc:  # pragma: no cover - the failure being tested
+                errors.append(exc)
+
+        threads = [threading.Thread(target=hammer, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert len(cache._data) <= 4
+
+    @respx.mock
+    def test_cache_keeps_response_bytes(self):
+        body = b'{"credits_remaining": 5, "note": "kept as sent"}'
+        route = respx.get(f"{API}/v1/stats").mock(return_value=httpx.Response(200, content=body))
+        with YouTubeTranscript("test_api_key") as yt:
+            assert yt.stats().credits_remaining == 5
+            [(_, cached)] = yt._cache._data.values()
+            assert cached == body
+            assert yt.stats().credits_remaining == 5
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_disk_cache_shares_url_and_bare_id(self, tmp_path):
+        route = respx.post(f"{API}/v2/transcribe").mock(return_value=httpx.Response(200, json={
+            "status": "completed",
+            "data": {"video_id": "dQw4w9WgXcQ", "segments": [{"text": "hi", "start": 0}]},
+        }))
+        with YouTubeTranscript("test_api_key", cache_dir=tmp_path) as yt:
+            yt.transcribe("https://youtu.be/dQw4w9WgXcQ")
+            yt.transcribe("dQw4w9WgXcQ")
+            yt.transcribe("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42")
+            yt.transcribe("not a video")
+        assert route.call_count == 2
+
+
+class TestWaitForJob:
+    @respx.mock
+    def test_poll_interval_ramps_up_to_cap(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("youtubetranscript.client.time.sleep", sleeps.append)
+        processing = httpx.Response(200, json={"job_id": "j1", "status": "processing"})
+        respx.get(f"{API}/v2/jobs/j1").mock(side_effect=[processing] * 4 + [
+            httpx.Response(200, json={
+                "job_id": "j1",
+                "status": "completed",
+                "data": {"video_id": "v", "transcript": {"segments": []}},
+            }),
+        ])
+        with YouTubeTranscript("test_api_key") as yt:
+            yt.wait_for_job("j1", max_poll_interval=5.0)
+        assert sleeps == [1.0, 2.0, 4.0, 5.0]
+
+    @respx.mock
+    def test_last_sleep_does_not_overshoot_timeout(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr("youtubetranscript.client.time.monotonic", lambda: clock[0])
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        monkeypatch.setattr("youtubetranscript.client.time.sleep", fake_sleep)
+        respx.get(f"{API}/v2/jobs/j1").mock(
+            return_value=httpx.Response(200, json={"job_id": "j1", "status": "processing"})
+        )
+        with YouTubeTranscript("test_api_key") as yt:
+            with pytest.raises(YouTubeTranscriptError, match="Timed out"):
+                yt.wait_for_job("j1", timeout=10.0)
+        assert clock[0] == 10.0
+
+    @respx.mock
+    def test_failed_job_reports_error(self):
+        respx.get(f"{API}/v2/jobs/j1").mock(return_value=httpx.Response(
+            200, json={"job_id": "j1", "status": "failed", "error": "audio unavailable"},
+        ))
+        with YouTubeTranscript("test_api_key") as yt:
+            with pytest.raises(YouTubeTranscriptError, match="audio unavailable"):
+                yt.wait_for_job("j1")
+
+    def test_rejects_non_positive_poll_interval(self):
+        with YouTubeTranscript("test_api_key") as yt:
+            for kwargs in ({"initial_poll_interval": 0}, {"max_poll_interval": -1.0}):
+                with pytest.raises(ValueError):
+                    yt.wait_for_job("j1", **kwargs)
+
+    @respx.mock
+    def test_first_interval_clamped_to_max(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("youtubetranscript.client.time.sleep", sleeps.append)
+        processing = httpx.Response(200, json={"job_id": "j1", "status": "processing"})
+        respx.get(f"{API}/v2/jobs/j1").mock(side_effect=[processing] * 2 + [
+            httpx.Response(200, json={
+                "job_id": "j1",
+                "status": "completed",
+                "data": {"video_id": "v", "transcript": {"segments": []}},
+            }),
+        ])
+        with YouTubeTranscript("test_api_key") as yt:
+            yt.wait_for_job("j1", initial_poll_interval=30.0, max_poll_interval=5.0)
+        assert sleeps == [5.0, 5.0]
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(2, 1.0)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert 0.4 < bucket.reserve() <= 0.5
+        assert 0.9 < bucket.reserve() <= 1.0
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0, 1.0)
+
+
+class TestSharedPool:
+    def test_instances_share_http_client(self):
+        a = YouTubeTranscript("test_api_key", shared_pool=True)
+        b = YouTubeTranscript("test_api_key", shared_pool=True)
+        c = YouTubeTranscript("test_api_key", timeout=5.0, shared_pool=True)
+        assert a._client is b._client
+        assert a._client is not c._client
+        a.close()
+        assert not b._client.is_closed
+
+    @respx.mock
+    def test_api_key_sent_per_request(self):
+        route = respx.get(f"{API}/v1/stats").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        YouTubeTranscript("first_api_key", shared_pool=True, cache_ttl=0).stats()
+        YouTubeTranscript("second_api_key", shared_pool=True, cache_ttl=0).stats()
+        auth = [call.request.headers["Authorization"] for call in route.calls]
+        assert auth == ["Bearer first_api_key", "Bearer second_api_key"]
+        assert "Content-Type" not in route.calls.last.request.headers
+
+    def test_close_is_idempotent_and_gc_closes(self):
+        yt = YouTubeTranscript("test_api_key")
+        client = yt._client
+        yt.close()
+        yt.close()
+        assert client.is_closed
+
+        yt = YouTubeTranscript("test_api_key")
+        client = yt._client
+        del yt
+        gc.collect()
+        assert client.is_closed
+
+
+class TestRetryPolicy:
+    @respx.mock
+    def test_post_not_retried_on_500(self):
+        route = respx.post(f"{API}/v2/transcribe").mock(
+            return_value=httpx.Response(500, json={"message": "boom"})
+        )
+        with YouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            with pytest.raises(ServerError):
+                yt.transcribe("dQw4w9WgXcQ")
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_post_retried_on_503(self):
+        route = respx.post(f"{API}/v2/transcribe").mock(side_effect=[
+            httpx.Response(503, json={"message": "busy"}),
+            httpx.Response(200, json={"data": {"video_id": "dQw4w9WgXcQ"}}),
+        ])
+        with YouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            assert yt.transcribe("dQw4w9WgXcQ").video_id == "dQw4w9WgXcQ"
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_post_not_retried_on_read_timeout(self):
+        route = respx.post(f"{API}/v2/transcribe").mock(side_effect=httpx.ReadTimeout("slow"))
+        with YouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            with pytest.raises(YouTubeTranscriptError):
+                yt.transcribe("dQw4w9WgXcQ")
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_non_json_error_body(self):
+        respx.get(f"{API}/v1/stats").mock(
+            return_value=httpx.Response(502, content=b"<html>Bad Gateway</html>")
+        )
+        with YouTubeTranscript("test_api_key", max_retries=0) as yt:
+            with pytest.raises(YouTubeTranscriptError, match="502: <html>Bad Gateway"):
+                yt.stats()
+
+    @respx.mock
+    def test_post_retried_on_html_503(self):
+        route = respx.post(f"{API}/v2/transcribe").mock(side_effect=[
+            httpx.Response(503, html="<html><body>Service Unavailable</body></html>"),
+            httpx.Response(200, json={"data": {"video_id": "dQw4w9WgXcQ"}}),
+        ])
+        with YouTubeTranscript("test_api_key", max_backoff=0) as yt:
+            assert yt.transcribe("dQw4w9WgXcQ").video_id == "dQw4w9WgXcQ"
+        assert route.call_count == 2
+
+
+class TestVideoId:
+    @pytest.mark.parametrize("value", [
+        "dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ?rel=0",
+    ])
+    def test_extracts_id(self, value):
+        assert parse_video_id(value) == "dQw4w9WgXcQ"
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError):
+            parse_video_id("https://example.com/not-a-video")
+
+    @respx.mock
+    def test_batch_sends_ids_and_fails_fast(self):
+        route = respx.post(f"{API}/v2/batch").mock(return_value=httpx.Response(200, json={}))
+        with YouTubeTranscript("test_api_key") as yt:
+            with pytest.raises(ValueError):
+                yt.batch(["dQw4w9WgXcQ", "oops"])
+            assert route.call_count == 0
+            yt.batch(["https://youtu.be/dQw4w9WgXcQ"])
+        assert json.loads(route.calls.last.request.content)["video_ids"] == ["dQw4w9WgXcQ"]